@@ -1,4 +1 @@
 from . import corpus, scheduler, optimizer, models
-
-import flair
-flair.debug = False
@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 from configparser import InterpolationError
@@ -10,7 +11,6 @@ import typer
 from click import NoSuchOption
 from click.parser import split_arg_string
 from confection import ConfigValidationError
-from flair import logger
 from typer.main import get_command
 from wasabi import msg
 
@@ -30,6 +30,9 @@ Opt = typer.Option
 
 app = typer.Typer(name=NAME, help=HELP)
 
+# Same logger as flair.logger, without importing flair (and torch) for the CLI
+logger = logging.getLogger("flair")
+
 
 def setup_cli() -> None:
     # Make sure the entry-point for CLI runs, so that they get imported.
@@ -63,8 +66,10 @@ def parse_config_overrides(
 
 def _parse_overrides(args: List[str], is_cli: bool = False) -> Dict[str, Any]:
     result = {}
-    while args:
-        opt = args.pop(0)
+    i = 0
+    while i < len(args):
+        opt = args[i]
+        i += 1
         err = f"Invalid config override '{opt}'"
         if opt.startswith("--"):  # new argument
             orig_opt = opt
@@ -78,22 +83,28 @@ def _parse_overrides(args: List[str], is_cli: bool = False) -> Dict[str, Any]:
                 opt, value = opt.split("=", 1)
                 opt = opt.replace("-", "_")
             else:
-                if not args or args[0].startswith("--"):  # flag with no value
+                if i == len(args) or args[i].startswith("--"):  # flag with no value
                     value = "true"
                 else:
-                    value = args.pop(0)
+                    value = args[i]
+                    i += 1
             result[opt] = _parse_override(value)
         else:
             msg.fail(f"{err}: name should start with --", exits=1)
     return result
 
 
+_COMMON_LITERALS = {"true": True, "false": False, "null": None}
+
+
 def _parse_override(value: Any) -> Any:
     # Just like we do in the config, we're calling json.loads on the
     # values. But since they come from the CLI, it'd be unintuitive to
     # explicitly mark strings with escaped quotes. So we're working
     # around that here by falling back to a string if parsing fails.
     # TODO: improve logic to handle simple types like list of strings?
+    if value in _COMMON_LITERALS:  # e.g. flags, skip the JSON parser
+        return _COMMON_LITERALS[value]
     try:
         return srsly.json_loads(value)
     except ValueError:
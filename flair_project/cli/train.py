@@ -1,9 +1,7 @@
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
-import flair
 import typer
-from flair.trainers import ModelTrainer
 from wasabi import msg
 
 import flair_project.utils as utils
@@ -32,9 +30,13 @@ def train(
     *,
     overrides: Optional[Dict[str, Any]] = None,
 ):
+    import flair
+    from flair.trainers import ModelTrainer
+
+    flair.debug = False
+
     config_path = utils.ensure_path(config_path)
     output_path = utils.ensure_path(output_path)
-    overrides = overrides or utils.SimpleFrozenDict()
     # Make sure all files and paths exists if they are needed
     if not config_path or (str(config_path) != "-" and not config_path.exists()):
         msg.fail("Config file not found", config_path, exits=1)
@@ -52,8 +54,9 @@ def train(
     resolved = registry.resolve(config)
     training_config = resolved["training"]
 
-    if "seed" in resolved["system"]:
-        flair.set_seed(resolved["system"]["seed"])
+    seed = resolved["system"].get("seed") if "system" in resolved else None
+    if seed is not None:
+        flair.set_seed(seed)
 
     trainer = ModelTrainer(training_config["model"], training_config["corpus"])
     lr = resolved["training"].get("lr", 0.1)
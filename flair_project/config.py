@@ -1,5 +1,4 @@
-import inspect
-from typing import Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import catalogue
 import confection
@@ -24,6 +23,8 @@ class registry(confection.registry):
     optimizers: Decorator = catalogue.create("flair", "optimizers", entry_points=True)
     schedulers: Decorator = catalogue.create("flair", "schedulers", entry_points=True)
 
+    _registry_names_cache: Optional[tuple] = None
+
     @classmethod
     def create(cls, registry_name: str, entry_points: bool = False) -> None:
         """Create a new custom registry."""
@@ -33,39 +34,26 @@ class registry(confection.registry):
             "thinc", registry_name, entry_points=entry_points
         )
         setattr(cls, registry_name, reg)
+        cls._registry_names_cache = None
 
     @classmethod
     def get_registry_names(cls) -> List[str]:
         """List all available registries."""
-        names = []
-        for name, value in inspect.getmembers(cls):
-            if not name.startswith("_") and isinstance(value, Registry):
-                names.append(name)
-        return sorted(names)
+        if cls._registry_names_cache is None:
+            # Walking the class dicts directly avoids binding every classmethod
+            # the way inspect.getmembers does.
+            names = set()
+            for klass in cls.__mro__:
+                for name, value in vars(klass).items():
+                    if not name.startswith("_") and isinstance(value, Registry):
+                        names.add(name)
+            cls._registry_names_cache = tuple(sorted(names))
+        return list(cls._registry_names_cache)
 
     @classmethod
     def get(cls, registry_name: str, func_name: str) -> Callable:
         """Get a registered function from the registry."""
-        if not hasattr(cls, registry_name):
-            names = ", ".join(cls.get_registry_names()) or "none"
-            raise RegistryError(Errors.E101.format(name=registry_name, available=names))
-        reg = getattr(cls, registry_name)
-        try:
-            func = reg.get(func_name)
-        except RegistryError:
-            if func_name.startswith("nlp."):
-                legacy_name = func_name.replace("nlp.", "nlp-legacy.")
-                try:
-                    return reg.get(legacy_name)
-                except catalogue.RegistryError:
-                    pass
-            available = ", ".join(sorted(reg.get_all().keys())) or "none"
-            raise RegistryError(
-                Errors.E102.format(
-                    name=func_name, reg_name=registry_name, available=available
-                )
-            ) from None
-        return func
+        return _cached_lookup(cls, registry_name, func_name, "get")
 
     @classmethod
     def find(
@@ -81,26 +69,8 @@ class registry(confection.registry):
         """
         # We're overwriting this classmethod so we're able to provide more
         # specific error messages and implement a fallback to spacy-legacy.
-        if not hasattr(cls, registry_name):
-            names = ", ".join(cls.get_registry_names()) or "none"
-            raise RegistryError(Errors.E101.format(name=registry_name, available=names))
-        reg = getattr(cls, registry_name)
-        try:
-            func_info = reg.find(func_name)
-        except RegistryError:
-            if func_name.startswith("nlp."):
-                legacy_name = func_name.replace("nlp.", "nlp-legacy.")
-                try:
-                    return reg.find(legacy_name)
-                except catalogue.RegistryError:
-                    pass
-            available = ", ".join(sorted(reg.get_all().keys())) or "none"
-            raise RegistryError(
-                Errors.E102.format(
-                    name=func_name, reg_name=registry_name, available=available
-                )
-            ) from None
-        return func_info
+        # The info dict is shared through the lookup cache, so hand out a copy.
+        return dict(_cached_lookup(cls, registry_name, func_name, "find"))
 
     @classmethod
     def has(cls, registry_name: str, func_name: str) -> bool:
@@ -114,6 +84,52 @@ class registry(confection.registry):
         return func_name in reg
 
 
+# Results of registry.get/find, keyed by (registry class, registry name,
+# function name, method). Each entry also stores the catalogue key the function
+# was found under and the object registered there at the time, see
+# _cached_lookup. Misses raise and are never stored.
+_lookup_cache: Dict[Tuple, Tuple[Tuple[str, ...], Any, Any]] = {}
+
+
+def _cached_lookup(cls: type, registry_name: str, func_name: str, method: str) -> Any:
+    cache_key = (cls, registry_name, func_name, method)
+    cached = _lookup_cache.get(cache_key)
+    if cached is not None:
+        namespace, registered, result = cached
+        # Only reuse the result while the name still maps to the same object,
+        # so functions that are registered again (e.g. after a live reload)
+        # are picked up. Entry points aren't stored in catalogue.REGISTRY and
+        # are fixed for the lifetime of the process.
+        if catalogue.REGISTRY.get(namespace) is registered:
+            return result
+    if not hasattr(cls, registry_name):
+        names = ", ".join(cls.get_registry_names()) or "none"
+        raise RegistryError(Errors.E101.format(name=registry_name, available=names))
+    reg = getattr(cls, registry_name)
+    lookup = getattr(reg, method)
+    name = None
+    try:
+        result = lookup(func_name)
+        name = func_name
+    except RegistryError:
+        pass
+    if name is None and func_name.startswith("nlp."):
+        legacy_name = func_name.replace("nlp.", "nlp-legacy.")
+        if legacy_name in reg:
+            result = lookup(legacy_name)
+            name = legacy_name
+    if name is None:
+        available = ", ".join(sorted(reg.get_all().keys())) or "none"
+        raise RegistryError(
+            Errors.E102.format(
+                name=func_name, reg_name=registry_name, available=available
+            )
+        )
+    namespace = (*reg.namespace, name)
+    _lookup_cache[cache_key] = (namespace, catalogue.REGISTRY.get(namespace), result)
+    return result
+
+
 __all__ = [
     "Config",
     "registry",
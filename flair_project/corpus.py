@@ -1,9 +1,6 @@
 from pathlib import Path
 from typing import Any, Optional, Union
 
-from flair.datasets.sequence_labeling import JsonlCorpus
-from flair.tokenization import Tokenizer
-
 from flair_project.config import registry
 
 
@@ -18,8 +15,12 @@ def create_jsonl_corpus(
     label_column_name: str = "label",
     metadata_column_name: str = "metadata",
     label_type: str = "ner",
-    use_tokenizer: Union[bool, Tokenizer] = True,
+    # flair.tokenization.Tokenizer, not imported here to keep the CLI startup
+    # free of flair
+    use_tokenizer: Union[bool, Any] = True,
 ):
+    from flair.datasets.sequence_labeling import JsonlCorpus
+
     return JsonlCorpus(
         data_folder,
         train_file=train_file,
@@ -1,36 +1,36 @@
-class ErrorsWithCodes(type):
-    def __getattribute__(self, code):
-        msg = super().__getattribute__(code)
-        if code.startswith("__"):  # python system attributes like __class__
-            return msg
-        else:
-            return "[{code}] {msg}".format(code=code, msg=msg)
+from types import SimpleNamespace
 
-
-class Errors(metaclass=ErrorsWithCodes):
+_RAW_ERRORS = {
     # system level error
-    E001 = "Could not read {name} from {path}"
-    E002 = (
+    "E001": "Could not read {name} from {path}",
+    "E002": (
         "Can't write to frozen dictionary. This is likely an internal "
         "error. Are you writing to a default function argument?"
-    )
+    ),
     # config & cli error
-    E101 = "Unknown function registry: '{name}'.\n\nAvailable names: {available}"
-    E102 = (
+    "E101": "Unknown function registry: '{name}'.\n\nAvailable names: {available}",
+    "E102": (
         "Could not find function '{name}' in function registry '{reg_name}'. "
         "If you're using a custom function, make sure the code is available. "
         "If the function is provided by a third-party package, e.g. , "
         "make sure the package is installed in your environment."
         "\n\nAvailable names: {available}"
-    )
-    E103 = (
+    ),
+    "E103": (
         "Found non-serializable Python object in config. Configs should "
         "only include values that can be serialized to JSON. If you need "
         "to pass models or other objects to your component, use a reference "
         "to a registered function or initialize the object in your "
         "component.\n\n{config}"
-    )
-    E104 = (
+    ),
+    "E104": (
         "Can't write to frozen list. Maybe you're trying to modify a computed "
         "property or default function argument?"
-    )
+    ),
+}
+
+# Messages are prefixed with their code once at import, e.g. Errors.E001 is
+# "[E001] Could not read {name} from {path}".
+Errors = SimpleNamespace(
+    **{code: f"[{code}] {msg}" for code, msg in _RAW_ERRORS.items()}
+)
@@ -1,7 +1,8 @@
 from flair_project.config import registry
-from flair.nn import Classifier
 
 
 @registry.architectures("flair.ner.v1")
 def build_ner():
+    from flair.nn import Classifier
+
     return Classifier.load("ner")
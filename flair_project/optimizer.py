@@ -1,25 +1,57 @@
-from flair import logger
-from flair.training_utils import log_line
-from torch.optim import AdamW
+import itertools
+import re
+from functools import lru_cache
+
 from flair_project.config import registry
 
+try:  # optional, falls back to a regex when not installed
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 patterns_optimizer = {
-    "additional_layers": ["additional"],
-    "top_layer": ["additional", "bert_model.encoder.layer.11."],
-    "top4_layers": [
+    "additional_layers": ("additional",),
+    "top_layer": ("additional", "bert_model.encoder.layer.11."),
+    "top4_layers": (
         "additional",
         "bert_model.encoder.layer.11.",
         "encoder.layer.10.",
         "encoder.layer.9.",
         "encoder.layer.8",
-    ],
-    "all_encoder_layers": ["additional", "bert_model.encoder.layer"],
-    "all": ["additional", "bert_model.encoder.layer", "bert_model.embeddings"],
+    ),
+    "all_encoder_layers": ("additional", "bert_model.encoder.layer"),
+    "all": ("additional", "bert_model.encoder.layer", "bert_model.embeddings"),
 }
+no_decay = ("bias", "gamma", "beta")
+
+# Number of parameter names shown per group when logging the optimizer setup.
+MAX_LOGGED_PARAMS = 5
+
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns):
+    """Build a function that checks whether a name contains any of the given
+    substrings. Uses an Aho-Corasick automaton if pyahocorasick is installed,
+    and a compiled regex otherwise. patterns are tuples, so each group is only
+    compiled once per process.
+    """
+    if not patterns:  # an empty regex would match every name
+        return lambda name: False
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return lambda name: next(automaton.iter(name), None) is not None
+    pattern_re = re.compile("|".join(map(re.escape, patterns)))
+    return lambda name: pattern_re.search(name) is not None
 
 
 def get_bert_params(models, type_optimization: str):
     """Optimizes the network with AdamWithDecay"""
+    from flair import logger
+    from flair.training_utils import log_line
+
     if type_optimization not in patterns_optimizer:
         print(
             "Error. Type optimizer must be one of %s" % (str(patterns_optimizer.keys()))
@@ -28,25 +60,43 @@ def get_bert_params(models, type_optimization: str):
     parameters_with_decay_names = []
     parameters_without_decay = []
     parameters_without_decay_names = []
-    no_decay = ["bias", "gamma", "beta"]
     patterns = patterns_optimizer[type_optimization]
+    matches_pattern = _compile_patterns(tuple(patterns))
+    matches_no_decay = _compile_patterns(no_decay)
 
     for model in models:
         for n, p in model.named_parameters():
-            if any(t in n for t in patterns):
-                if any(t in n for t in no_decay):
+            if matches_pattern(n):
+                # only the first few names are ever logged, don't keep the rest
+                if matches_no_decay(n):
+                    if len(parameters_without_decay) < MAX_LOGGED_PARAMS:
+                        parameters_without_decay_names.append(n)
                     parameters_without_decay.append(p)
-                    parameters_without_decay_names.append(n)
                 else:
+                    if len(parameters_with_decay) < MAX_LOGGED_PARAMS:
+                        parameters_with_decay_names.append(n)
                     parameters_with_decay.append(p)
-                    parameters_with_decay_names.append(n)
 
     log_line(logger)
     logger.info("The following parameters will be optimized WITH decay:")
-    logger.info(ellipses(parameters_with_decay_names, 5, " , "))
+    logger.info(
+        ellipses(
+            parameters_with_decay_names,
+            MAX_LOGGED_PARAMS,
+            " , ",
+            total=len(parameters_with_decay),
+        )
+    )
     log_line(logger)
     logger.info("The following parameters will be optimized WITHOUT decay:")
-    logger.info(ellipses(parameters_without_decay_names, 5, " , "))
+    logger.info(
+        ellipses(
+            parameters_without_decay_names,
+            MAX_LOGGED_PARAMS,
+            " , ",
+            total=len(parameters_without_decay),
+        )
+    )
     log_line(logger)
 
     optimizer_grouped_parameters = [
@@ -57,21 +107,29 @@ def get_bert_params(models, type_optimization: str):
     return optimizer_grouped_parameters
 
 
-def ellipses(lst, max_display=5, sep="|"):
+def ellipses(lst, max_display=5, sep="|", total=None):
     """
     Like join, but possibly inserts an ellipsis.
     :param lst: The list to join on
     :param int max_display: the number of items to display for ellipsing.
         If -1, shows all items
     :param string sep: the delimiter to join on
+    :param int total: the full number of items, if lst was already truncated.
+        Defaults to len(lst)
     """
-    # copy the list (or force it to a list if it's a set)
-    choices = list(lst)
+    if max_display <= 0:
+        return sep.join(map(str, lst))
+    # only materialize the items that are displayed, and count the rest
+    it = iter(lst)
+    choices = list(itertools.islice(it, max_display))
+    if total is None:
+        rest = sum(1 for _ in it)
+    else:
+        rest = total - len(choices)
     # insert the ellipsis if necessary
-    if 0 < max_display < len(choices):
-        ellipsis_tail = "...and {} more".format(len(choices) - max_display)
-        choices = choices[:max_display] + [ellipsis_tail]
-    return sep.join(str(c) for c in choices)
+    if rest > 0:
+        choices.append("...and {} more".format(rest))
+    return sep.join(map(str, choices))
 
 
 @registry.optimizers("flair.AdamW.v1")
@@ -79,6 +137,8 @@ def create_adamw(
         params,
         lr: float,
 ):
+    from torch.optim import AdamW
+
     return AdamW(params, lr=lr)
 
 
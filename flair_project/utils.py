@@ -1,7 +1,9 @@
 import inspect
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Union
+from types import CodeType, MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from .config import Config
 from .errors import Errors
@@ -20,6 +22,12 @@ CONFIG_SECTION_ORDER = [
     "initialize",
 ]
 
+# Parsed configs loaded from disk, keyed by path, file contents, overrides and
+# interpolation. See load_config. Holds at most _CONFIG_CACHE_SIZE entries, the
+# oldest one is dropped first.
+_CONFIG_CACHE_SIZE = 32
+_config_cache: Dict[Tuple, Config] = {}
+
 
 class SimpleFrozenList(list):
     """Wrapper class around a list that lets us raise custom errors if certain
@@ -62,29 +70,20 @@ class SimpleFrozenList(list):
         raise NotImplementedError(self.error)
 
 
-class SimpleFrozenDict(dict):
-    """Simplified implementation of a frozen dict, mainly used as default
-    function or method argument (for arguments that should default to empty
-    dictionary). Will raise an error if user or spaCy attempts to add to dict.
+def SimpleFrozenDict(*args, **kwargs) -> Mapping[str, Any]:
+    """Read-only dict, mainly used as default function or method argument (for
+    arguments that should default to empty dictionary). Returns a
+    MappingProxyType, so assigning to it raises a TypeError. Takes the same
+    arguments as dict(); the custom error= message of the old frozen dict
+    class is no longer supported and passing it raises a TypeError.
     """
+    if "error" in kwargs:
+        raise TypeError("SimpleFrozenDict() no longer takes an 'error' argument")
+    return MappingProxyType(dict(*args, **kwargs))
 
-    def __init__(self, *args, error: str = Errors.E002, **kwargs) -> None:
-        """Initialize the frozen dict. Can be initialized with pre-defined
-        values.
 
-        error (str): The error message when user tries to assign to dict.
-        """
-        super().__init__(*args, **kwargs)
-        self.error = error
-
-    def __setitem__(self, key, value):
-        raise NotImplementedError(self.error)
-
-    def pop(self, key, default=None):
-        raise NotImplementedError(self.error)
-
-    def update(self, *other):
-        raise NotImplementedError(self.error)
+# Shared empty default for overrides, so no dict is created per call.
+_EMPTY_FROZEN: Mapping[str, Any] = MappingProxyType({})
 
 
 def ensure_path(path: Any) -> Any:
@@ -94,11 +93,17 @@ def ensure_path(path: Any) -> Any:
     RETURNS: Path or original argument.
     """
     if isinstance(path, str):
-        return Path(path)
+        return _str_to_path(path)
     else:
         return path
 
 
+@lru_cache(maxsize=256)
+def _str_to_path(path: str) -> Path:
+    # Path objects are immutable, so the same instance can be handed out again.
+    return Path(path)
+
+
 def load_config(
     path: Union[str, Path],
     overrides: Dict[str, Any] = None,
@@ -114,7 +119,7 @@ def load_config(
     """
     config_path = ensure_path(path)
     config = Config(section_order=CONFIG_SECTION_ORDER)
-    overrides = overrides or SimpleFrozenDict()
+    overrides = overrides or _EMPTY_FROZEN
     if str(config_path) == "-":  # read from standard input
         return config.from_str(
             sys.stdin.read(), overrides=overrides, interpolate=interpolate
@@ -122,9 +127,56 @@ def load_config(
     else:
         if not config_path or not config_path.is_file():
             raise IOError(Errors.E001.format(path=config_path, name="config file"))
-        return config.from_disk(
-            config_path, overrides=overrides, interpolate=interpolate
-        )
+        text = config_path.read_text(encoding="utf8")
+        key = _get_config_cache_key(config_path, text, overrides, interpolate)
+        if key is not None and key in _config_cache:
+            return copy_config(_config_cache[key])
+        if interpolate:
+            if _needs_interpolation(text, overrides):
+                config = config.from_str(text, overrides=overrides, interpolate=True)
+            else:
+                # Interpolation would be a no-op, so skip it. Mark the result as
+                # interpolated though, so resolve/fill don't interpolate it
+                # (again) themselves.
+                config = config.from_str(text, overrides=overrides, interpolate=False)
+                config.is_interpolated = True
+        else:
+            config = config.from_str(text, overrides=overrides, interpolate=False)
+        if key is not None:
+            # Hand out copies only, so callers can't modify the cached config.
+            # This costs one extra copy on a miss (e.g. a one-off CLI run), which
+            # is small next to parsing the config in the first place.
+            if len(_config_cache) >= _CONFIG_CACHE_SIZE:
+                del _config_cache[next(iter(_config_cache))]
+            _config_cache[key] = config
+            return copy_config(config)
+        return config
+
+
+def _needs_interpolation(text: str, overrides: Dict[str, Any]) -> bool:
+    # Interpolating doesn't only substitute variables: confection also unquotes
+    # JSON strings before parsing (so "42" is read as 42), and with overrides
+    # it round-trips the whole config. The result only matches a plain parse if
+    # there are no overrides, no "$" (variables or "$$" escapes) and no quotes.
+    return bool(overrides) or "$" in text or '"' in text
+
+
+def _get_config_cache_key(
+    config_path: Path, text: str, overrides: Dict[str, Any], interpolate: bool
+) -> Optional[Tuple]:
+    # Keyed on the file contents rather than its mtime, which may not change
+    # when a file is rewritten quickly on filesystems with coarse timestamps.
+    key = (
+        str(config_path.resolve()),
+        text,
+        tuple(sorted(overrides.items())),
+        interpolate,
+    )
+    try:
+        hash(key)
+    except TypeError:  # unhashable override values, e.g. lists
+        return None
+    return key
 
 
 def copy_config(config: Union[Dict[str, Any], Config]) -> Config:
@@ -169,10 +221,11 @@ def dot_to_dict(values: Dict[str, Any]) -> Dict[str, dict]:
     result: Dict[str, dict] = {}
     for key, value in values.items():
         path = result
-        parts = key.lower().split(".")
-        for i, item in enumerate(parts):
-            is_last = i == len(parts) - 1
-            path = path.setdefault(item, value if is_last else {})
+        # str.lower always allocates, and override keys are usually lowercase
+        parts = key.split(".") if key.islower() else key.lower().split(".")
+        for item in parts[:-1]:
+            path = path.setdefault(item, {})
+        path.setdefault(parts[-1], value)
     return result
 
 
@@ -187,14 +240,30 @@ def is_same_func(func1: Callable, func2: Callable) -> bool:
     func2 (Callable): The second function.
     RETURNS (bool): Whether it's the same function (most likely).
     """
+    if func1 is func2:
+        return callable(func1)
     if not callable(func1) or not callable(func2):
         return False
     if not hasattr(func1, "__qualname__") or not hasattr(func2, "__qualname__"):
         return False
-    same_name = func1.__qualname__ == func2.__qualname__
-    same_file = inspect.getfile(func1) == inspect.getfile(func2)
-    same_code = inspect.getsourcelines(func1) == inspect.getsourcelines(func2)
-    return same_name and same_file and same_code
+    if func1.__qualname__ != func2.__qualname__:
+        return False
+    code1 = getattr(func1, "__code__", None)
+    code2 = getattr(func2, "__code__", None)
+    if code1 is None or code2 is None:  # e.g. classes
+        same_file = inspect.getfile(func1) == inspect.getfile(func2)
+        same_code = inspect.getsourcelines(func1) == inspect.getsourcelines(func2)
+        return same_file and same_code
+    if code1.co_filename != code2.co_filename:
+        return False
+    if code1.co_firstlineno == code2.co_firstlineno and code1.co_code == code2.co_code:
+        return True
+    return _is_same_source(code1, code2)
+
+
+@lru_cache(maxsize=256)
+def _is_same_source(code1: CodeType, code2: CodeType) -> bool:
+    return inspect.getsourcelines(code1) == inspect.getsourcelines(code2)
 
 
 def get_arg_names(func: Callable) -> List[str]: